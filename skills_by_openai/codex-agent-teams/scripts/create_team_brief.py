@@ -4,6 +4,8 @@
 from __future__ import annotations
 
 import argparse
+import re
+from collections.abc import Iterator
 from datetime import date
 from pathlib import Path
 
@@ -56,6 +58,37 @@ DEFAULT_SKILLS = [
     "superpowers:verification-before-completion",
 ]
 
+CSV_SEPARATOR = re.compile(r"\s*,\s*")
+
+BRIEF_ROLES_HEADER = "\n## Roles\n| Role | Mission | Deliverables |\n| --- | --- | --- |\n"
+
+BRIEF_WORKSTREAMS_HEADER = (
+    "\n## Workstreams\n"
+    "| Workstream | Owner | Status | Verification |\n"
+    "| --- | --- | --- | --- |\n"
+)
+
+BRIEF_PROTOCOLS = """
+## Handoff Protocol
+1. Lead posts assignment with owner, boundary, and deadline.
+2. Specialist returns summary, touched scope, verification output, and risks.
+3. Reviewer validates spec and quality before status changes to complete.
+4. Lead records decision and next action in this brief.
+
+## Debate and Reflection Protocol
+1. For conflicting approaches, open a formal debate linked to the blocked task.
+2. Require one position per debate member with option, rationale, and confidence.
+3. Decide with explicit rationale, then apply outcome to task status/owner.
+4. Broadcast the chosen path and resume implementation on the linked task.
+
+## Decision Log
+- [ ] Decision:
+  Context:
+  Chosen option:
+  Why:
+  Follow-up:
+"""
+
 
 def validate_team_name(team_name: str) -> str:
     if not isinstance(team_name, str) or not team_name:
@@ -74,31 +107,30 @@ def validate_team_name(team_name: str) -> str:
 def parse_csv(value: str | None) -> list[str]:
     if not value:
         return []
-    return [item.strip() for item in value.split(",") if item.strip()]
+    return [item for item in CSV_SEPARATOR.split(value.strip()) if item]
 
 
-def role_rows(roles: list[str]) -> str:
-    rows: list[str] = []
+def role_rows(roles: list[str]) -> Iterator[str]:
     for role in roles:
         mission, deliverables = ROLE_PRESETS.get(
             role,
             ("Define mission for this role.", "Define expected deliverables."),
         )
-        rows.append(f"| {role} | {mission} | {deliverables} |")
-    return "\n".join(rows)
+        yield f"| {role} | {mission} | {deliverables} |\n"
 
 
-def workstream_rows(workstreams: list[str], verification: list[str]) -> str:
+def workstream_rows(workstreams: list[str], verification: list[str]) -> Iterator[str]:
     verify = "; ".join(verification) if verification else "TBD"
-    return "\n".join(
-        f"| {workstream} | TBD | planned | {verify} |" for workstream in workstreams
-    )
+    for workstream in workstreams:
+        yield f"| {workstream} | TBD | planned | {verify} |\n"
 
 
-def markdown_list(items: list[str], empty_value: str) -> str:
+def markdown_list(items: list[str], empty_value: str) -> Iterator[str]:
     if not items:
-        return f"- {empty_value}"
-    return "\n".join(f"- {item}" for item in items)
+        yield f"- {empty_value}\n"
+        return
+    for item in items:
+        yield f"- {item}\n"
 
 
 def build_brief(
@@ -113,62 +145,31 @@ def build_brief(
     skill_refs: list[str],
     communication_mode: str,
     delegate_mode: bool,
+    today: str | None = None,
 ) -> str:
     topology_note = TOPOLOGY_NOTES[topology]
     delegate_mode_value = "enabled" if delegate_mode else "disabled"
-    return f"""# Team Brief: {team_name}
-
-Date: {date.today().isoformat()}
-
-## Goal
-{goal}
-
-## Topology
-- Choice: {topology}
-- Note: {topology_note}
-
-## Team Modes
-- Communication: {communication_mode}
-- Delegate mode: {delegate_mode_value}
-
-## Definition of Done
-{markdown_list(done_criteria, "Define completion criteria.")}
-
-## Constraints
-{markdown_list(constraints, "No additional constraints supplied.")}
-
-## Skill Links
-{markdown_list(skill_refs, "No skill links supplied.")}
-
-## Roles
-| Role | Mission | Deliverables |
-| --- | --- | --- |
-{role_rows(roles)}
-
-## Workstreams
-| Workstream | Owner | Status | Verification |
-| --- | --- | --- | --- |
-{workstream_rows(workstreams, verification)}
-
-## Handoff Protocol
-1. Lead posts assignment with owner, boundary, and deadline.
-2. Specialist returns summary, touched scope, verification output, and risks.
-3. Reviewer validates spec and quality before status changes to complete.
-4. Lead records decision and next action in this brief.
-
-## Debate and Reflection Protocol
-1. For conflicting approaches, open a formal debate linked to the blocked task.
-2. Require one position per debate member with option, rationale, and confidence.
-3. Decide with explicit rationale, then apply outcome to task status/owner.
-4. Broadcast the chosen path and resume implementation on the linked task.
-
-## Decision Log
-- [ ] Decision:
-  Context:
-  Chosen option:
-  Why:
-  Follow-up:
-"""
+    parts: list[str] = [
+        f"# Team Brief: {team_name}\n\n",
+        f"Date: {today or date.today().isoformat()}\n\n",
+        f"## Goal\n{goal}\n\n",
+        f"## Topology\n- Choice: {topology}\n- Note: {topology_note}\n\n",
+        "## Team Modes\n",
+        f"- Communication: {communication_mode}\n",
+        f"- Delegate mode: {delegate_mode_value}\n\n",
+        "## Definition of Done\n",
+    ]
+    parts.extend(markdown_list(done_criteria, "Define completion criteria."))
+    parts.append("\n## Constraints\n")
+    parts.extend(markdown_list(constraints, "No additional constraints supplied."))
+    parts.append("\n## Skill Links\n")
+    parts.extend(markdown_list(skill_refs, "No skill links supplied."))
+    parts.append(BRIEF_ROLES_HEADER)
+    parts.extend(role_rows(roles))
+    parts.append(BRIEF_WORKSTREAMS_HEADER)
+    parts.extend(workstream_rows(workstreams, verification))
+    parts.append(BRIEF_PROTOCOLS)
+    return "".join(parts)
 
 
 def parse_args() -> argparse.Namespace:
@@ -255,6 +256,7 @@ def main() -> int:
         skill_refs=skill_refs,
         communication_mode=args.communication_mode,
         delegate_mode=args.delegate_mode,
+        today=date.today().isoformat(),
     )
 
     if args.output:
@@ -12,23 +12,39 @@ Provides simple shared-state primitives:
 from __future__ import annotations
 
 import argparse
+import atexit
 import contextlib
-import difflib
+import functools
 import json
 import math
+import mmap
 import os
 import re
 import shutil
+import stat
 import sys
-import tempfile
 import time
-import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # non-POSIX platforms fall back to O_EXCL lock files
+    fcntl = None
+
 TEAM_ROOT = Path(".codex/teams")
-TASK_STATUSES = {"pending", "in_progress", "completed"}
-DEBATE_STATUSES = {"open", "decided", "applied"}
+TASK_STATUSES = frozenset({"pending", "in_progress", "completed"})
+TASK_STATUS_CHOICES = ", ".join(sorted(TASK_STATUSES))
+DEBATE_STATUSES = frozenset({"open", "decided", "applied"})
+MONITOR_EVENT_FIELDS = (
+    "team_name",
+    "event_type",
+    "command",
+    "actor",
+    "entity_type",
+    "entity_id",
+    "at",
+)
 MONITORING_ENV = "TEAM_OPS_MONITORING"
 MONITOR_LOG_ENV = "TEAM_OPS_MONITOR_LOG_FILE"
 TEAM_ROOT_ENV = "TEAM_OPS_ROOT"
@@ -36,35 +52,60 @@ UNASSIGNED_OWNER = "unassigned"
 TEAM_ROOT_IS_EXPLICIT = False
 LOCK_WAIT_ENV = "TEAM_OPS_LOCK_WAIT_SECONDS"
 LOCK_STALE_ENV = "TEAM_OPS_LOCK_STALE_SECONDS"
+DURABLE_ENV = "TEAM_OPS_DURABLE"
+TRUTHY_ENV_VALUES = frozenset({"1", "true", "yes", "on"})
+FALSY_ENV_VALUES = frozenset({"0", "false", "no", "off"})
 DEFAULT_LOCK_WAIT_SECONDS = 15.0
 DEFAULT_LOCK_STALE_SECONDS = 300.0
+LOCK_POLL_MIN_SECONDS = 0.005
+LOCK_POLL_MAX_SECONDS = 0.2
+FLOCK_LOCK_MARKER = "flock"
+UTC_PREFIX_CACHE: tuple[int, str] = (-1, "")
+TEAM_NAME_PATTERN = re.compile(r"[^\s/\\\x00-\x1f\x7f]+")
+ISO_OFFSET_HHMM_PATTERN = re.compile(
+    r"^(.*[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)([+-]\d{2})(\d{2})$"
+)
+ISO_OFFSET_HH_PATTERN = re.compile(r"^(.*[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)([+-]\d{2})$")
+# Open until the command ends or the team lock is released.
+APPEND_HANDLES: dict[str, object] = {}
+LINE_NOT_OBJECT_PATTERN = re.compile(rb"\n[^{]|[^}]\n")
+TEAM_STATE_CACHE: dict[str, tuple[tuple[int, int, int], dict[str, object]]] = {}
+TEAM_ROSTER_CACHE: dict[str, tuple[dict[str, object], tuple[list[str], frozenset[str]]]] = {}
 
 
 def utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    # Same text as datetime.now(timezone.utc).isoformat().
+    global UTC_PREFIX_CACHE
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = UTC_PREFIX_CACHE
+    if cached_seconds != seconds:
+        tm = time.gmtime(seconds)
+        prefix = (
+            f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+            f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+        )
+        UTC_PREFIX_CACHE = (seconds, prefix)
+    micros = nanos // 1000
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return f"{prefix}+00:00"
 
 
 def parse_iso_datetime(value: str) -> datetime | None:
     normalized = value.strip()
     if not normalized:
         return None
-    if normalized.endswith("Z") or normalized.endswith("z"):
+    if normalized.endswith(("Z", "z")):
         normalized = normalized[:-1] + "+00:00"
-    else:
+    elif not normalized.endswith("+00:00"):
         # Accept common ISO-8601 offset variants:
         # - basic form: +0000 / -0530
         # - hour-only form: +00 / -05
-        match_hhmm = re.match(
-            r"^(.*[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)([+-]\d{2})(\d{2})$",
-            normalized,
-        )
+        match_hhmm = ISO_OFFSET_HHMM_PATTERN.match(normalized)
         if match_hhmm:
             normalized = f"{match_hhmm.group(1)}{match_hhmm.group(2)}:{match_hhmm.group(3)}"
         else:
-            match_hh = re.match(
-                r"^(.*[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)([+-]\d{2})$",
-                normalized,
-            )
+            match_hh = ISO_OFFSET_HH_PATTERN.match(normalized)
             if match_hh:
                 normalized = f"{match_hh.group(1)}{match_hh.group(2)}:00"
     try:
@@ -79,19 +120,19 @@ def parse_iso_datetime(value: str) -> datetime | None:
 def parse_csv(value: str | None) -> list[str]:
     if not value:
         return []
-    return [item.strip() for item in value.split(",") if item.strip()]
+    return [item for raw in value.split(",") if (item := raw.strip())]
 
 
 def parse_owner_map(value: str | None) -> dict[str, str]:
     mapping: dict[str, str] = {}
     for item in parse_csv(value):
-        if ":" not in item:
+        option, separator, owner = item.partition(":")
+        if not separator:
             raise SystemExit(
                 "--owner-map entries must be in 'option:owner' format, separated by commas."
             )
-        option, owner = item.split(":", 1)
-        option = option.strip()
-        owner = owner.strip()
+        option = option.rstrip()
+        owner = owner.lstrip()
         if not option or not owner:
             raise SystemExit(
                 "--owner-map entries must include both option and owner (option:owner)."
@@ -104,12 +145,18 @@ def parse_owner_map(value: str | None) -> dict[str, str]:
     return mapping
 
 
+@functools.lru_cache(maxsize=4)
+def resolved_ancestors(start: str) -> tuple[Path, ...]:
+    current = Path(start).resolve(strict=False)
+    return (current, *current.parents)
+
+
 def discover_workspace_root(start: Path) -> Path:
-    current = start.resolve(strict=False)
-    for candidate in (current, *current.parents):
+    ancestors = resolved_ancestors(os.fspath(start))
+    for candidate in ancestors:
         if (candidate / ".codex").is_dir():
             return candidate
-    return current
+    return ancestors[0]
 
 
 def resolve_team_root(explicit: str | None) -> Path:
@@ -145,9 +192,14 @@ def team_lock_path(team_name: str) -> Path:
 
 def read_lock_pid(lock_path: Path) -> int | None:
     try:
-        lines = lock_path.read_text(encoding="utf-8").splitlines()
+        text = lock_path.read_text(encoding="utf-8")
     except OSError:
         return None
+    return lock_pid_from_text(text)
+
+
+def lock_pid_from_text(text: str) -> int | None:
+    lines = text.splitlines()
     if len(lines) < 2:
         return None
     try:
@@ -199,6 +251,130 @@ def reclaim_stale_lock(lock_path: Path, *, stale_seconds: float) -> bool:
         return False
 
 
+def lock_timeout_error(lock_path: Path) -> SystemExit:
+    return SystemExit(
+        f"Timed out waiting for team lock at {lock_path}. "
+        f"Another command may still be writing state. Retry, or tune {LOCK_WAIT_ENV}."
+    )
+
+
+def lock_backoff(lock_path: Path, delay: float, *, wait_seconds: float, start: float) -> float:
+    """Sleep before the next lock attempt and return the delay to use after it."""
+    remaining = wait_seconds - (time.monotonic() - start)
+    if remaining <= 0:
+        raise lock_timeout_error(lock_path)
+    time.sleep(min(delay, remaining))
+    return min(delay * 2, LOCK_POLL_MAX_SECONDS)
+
+
+def open_flock_lock_file(lock_path: Path) -> tuple[int, bool]:
+    """Open the lock file, returning the fd and whether this call created it."""
+    while True:
+        try:
+            try:
+                return os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o600), True
+            except FileExistsError:
+                pass
+            try:
+                return os.open(str(lock_path), os.O_RDWR), False
+            except FileNotFoundError:
+                continue
+        except OSError as exc:
+            raise SystemExit(
+                f"Unable to acquire team lock at {lock_path}: {exc.strerror or exc}."
+            ) from exc
+
+
+def flock_lock_is_current(
+    lock_path: Path, fd: int, *, created: bool, stale_seconds: float
+) -> bool:
+    """Return whether holding the flock on fd really means holding the team lock.
+
+    Versions without flock take the lock by creating the file with O_EXCL and
+    delete it on exit, so a file left by a live holder of that kind counts as
+    held, and an fd whose file has since been deleted or replaced is stale.
+    """
+    try:
+        opened = os.fstat(fd)
+        current = os.stat(lock_path)
+    except OSError:
+        return False
+    if (opened.st_ino, opened.st_dev) != (current.st_ino, current.st_dev):
+        return False
+    try:
+        text = os.pread(fd, 256, 0).decode("utf-8", errors="replace")
+    except OSError:
+        return True
+    lines = text.splitlines()
+    if len(lines) >= 3 and lines[2] == FLOCK_LOCK_MARKER:
+        return True
+    pid = lock_pid_from_text(text)
+    if pid is None:
+        # An O_EXCL holder creates the file before writing its PID.
+        return created or (time.time() - current.st_mtime) > stale_seconds
+    return not process_is_running(pid)
+
+
+def unlink_flock_lock_file(lock_path: Path, fd: int) -> None:
+    try:
+        opened = os.fstat(fd)
+        current = os.stat(lock_path)
+        if (opened.st_ino, opened.st_dev) == (current.st_ino, current.st_dev):
+            lock_path.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        raise SystemExit(
+            f"Unable to release team lock at {lock_path}: {exc.strerror or exc}."
+        ) from exc
+
+
+@contextlib.contextmanager
+def flock_team_lock(
+    lock_path: Path, *, wait_seconds: float, stale_seconds: float, start: float
+) -> object:
+    # The kernel drops flock locks when the holder exits, so a crash needs no
+    # stale-lock reclamation. A clean release deletes the file first, so O_EXCL
+    # lockers see the lock as free; waiters re-check it via flock_lock_is_current.
+    fd: int | None
+    fd, created = open_flock_lock_file(lock_path)
+    try:
+        delay = LOCK_POLL_MIN_SECONDS
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                delay = lock_backoff(lock_path, delay, wait_seconds=wait_seconds, start=start)
+                continue
+            except OSError as exc:
+                raise SystemExit(
+                    f"Unable to acquire team lock at {lock_path}: {exc.strerror or exc}."
+                ) from exc
+            if flock_lock_is_current(
+                lock_path, fd, created=created, stale_seconds=stale_seconds
+            ):
+                break
+            os.close(fd)
+            fd = None
+            delay = lock_backoff(lock_path, delay, wait_seconds=wait_seconds, start=start)
+            fd, created = open_flock_lock_file(lock_path)
+        try:
+            os.ftruncate(fd, 0)
+            os.write(
+                fd, f"{time.time()}\n{os.getpid()}\n{FLOCK_LOCK_MARKER}\n".encode("utf-8")
+            )
+        except OSError:
+            pass
+        try:
+            yield
+        finally:
+            close_append_handles()
+            unlink_flock_lock_file(lock_path, fd)
+    finally:
+        if fd is not None:
+            os.close(fd)
+
+
 @contextlib.contextmanager
 def team_state_lock(team_name: str) -> object:
     lock_path = team_lock_path(team_name)
@@ -217,18 +393,21 @@ def team_state_lock(team_name: str) -> object:
     )
     start = time.monotonic()
 
+    if fcntl is not None:
+        with flock_team_lock(
+            lock_path, wait_seconds=wait_seconds, stale_seconds=stale_seconds, start=start
+        ):
+            yield
+        return
+
+    delay = LOCK_POLL_MIN_SECONDS
     while True:
         try:
             fd = os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
         except FileExistsError:
             if reclaim_stale_lock(lock_path, stale_seconds=stale_seconds):
                 continue
-            if (time.monotonic() - start) >= wait_seconds:
-                raise SystemExit(
-                    f"Timed out waiting for team lock at {lock_path}. "
-                    f"Another command may still be writing state. Retry, or tune {LOCK_WAIT_ENV}."
-                )
-            time.sleep(0.05)
+            delay = lock_backoff(lock_path, delay, wait_seconds=wait_seconds, start=start)
             continue
         except OSError as exc:
             raise SystemExit(
@@ -240,6 +419,7 @@ def team_state_lock(team_name: str) -> object:
                 handle.write(f"{time.time()}\n{os.getpid()}\n")
             yield
         finally:
+            close_append_handles()
             try:
                 lock_path.unlink()
             except FileNotFoundError:
@@ -252,6 +432,13 @@ def team_state_lock(team_name: str) -> object:
 
 
 def validate_team_name(team_name: str) -> str:
+    # The checks below only pick the error message.
+    if (
+        isinstance(team_name, str)
+        and TEAM_NAME_PATTERN.fullmatch(team_name)
+        and team_name not in {".", ".."}
+    ):
+        return team_name
     if not isinstance(team_name, str) or not team_name:
         raise SystemExit("--team-name must be a non-empty string.")
     if team_name in {".", ".."} or "/" in team_name or "\\" in team_name:
@@ -265,36 +452,41 @@ def validate_team_name(team_name: str) -> str:
     return team_name
 
 
+@functools.lru_cache(maxsize=64)
+def team_path(root: Path, team_name: str, filename: str | None = None) -> Path:
+    # Keyed on the root as well, since require_team() may switch TEAM_ROOT.
+    path = root / validate_team_name(team_name)
+    return path / filename if filename else path
+
+
 def team_dir(team_name: str) -> Path:
-    team_name = validate_team_name(team_name)
-    return TEAM_ROOT / team_name
+    return team_path(TEAM_ROOT, team_name)
 
 
 def team_file(team_name: str) -> Path:
-    return team_dir(team_name) / "team.json"
+    return team_path(TEAM_ROOT, team_name, "team.json")
 
 
 def task_file(team_name: str) -> Path:
-    return team_dir(team_name) / "tasks.json"
+    return team_path(TEAM_ROOT, team_name, "tasks.json")
 
 
 def debate_file(team_name: str) -> Path:
-    return team_dir(team_name) / "debates.json"
+    return team_path(TEAM_ROOT, team_name, "debates.json")
 
 
 def message_file(team_name: str) -> Path:
-    return team_dir(team_name) / "messages.jsonl"
+    return team_path(TEAM_ROOT, team_name, "messages.jsonl")
 
 
 def monitor_file(team_name: str) -> Path:
-    return team_dir(team_name) / "monitor.jsonl"
+    return team_path(TEAM_ROOT, team_name, "monitor.jsonl")
 
 
 def discover_team_roots_for_name(team_name: str) -> list[Path]:
     roots: list[Path] = []
     seen: set[Path] = set()
-    cwd = Path.cwd().resolve(strict=False)
-    for candidate in (cwd, *cwd.parents):
+    for candidate in resolved_ancestors(os.getcwd()):
         root = candidate / ".codex" / "teams"
         meta = root / team_name / "team.json"
         if not meta.is_file():
@@ -348,38 +540,63 @@ def require_team(team_name: str) -> None:
 
 def load_team_state(team_name: str) -> dict[str, object]:
     require_team(team_name)
-    payload = load_json(team_file(team_name), {})
+    path = team_file(team_name)
+    # Atomic rewrites always get a new inode, so this also catches same-size edits.
+    try:
+        info = path.stat()
+        stat_key = (info.st_ino, info.st_mtime_ns, info.st_size)
+    except OSError:
+        stat_key = None
+    cached = TEAM_STATE_CACHE.get(os.fspath(path))
+    if stat_key is not None and cached is not None and cached[0] == stat_key:
+        return cached[1]
+    payload = load_json(path, {})
     if not isinstance(payload, dict):
         raise SystemExit(
             f"Team metadata is corrupted for team '{team_name}': expected JSON object."
         )
+    if stat_key is not None:
+        TEAM_STATE_CACHE[os.fspath(path)] = (stat_key, payload)
     return payload
 
 
 def load_team_members(team_name: str) -> list[str]:
+    return load_team_roster(team_name)[0]
+
+
+def load_team_roster(team_name: str) -> tuple[list[str], frozenset[str]]:
+    """Return the validated member list together with a set for membership checks."""
     payload = load_team_state(team_name)
+    cached = TEAM_ROSTER_CACHE.get(team_name)
+    if cached is not None and cached[0] is payload:
+        return cached[1]
     members = payload.get("members")
     if not isinstance(members, list):
         raise SystemExit(
             f"Team metadata is corrupted for team '{team_name}': 'members' must be a JSON array."
         )
-    normalized: list[str] = []
-    for index, member in enumerate(members):
-        if not isinstance(member, str) or not member:
-            raise SystemExit(
-                f"Team metadata is corrupted for team '{team_name}': members[{index}] must be a non-empty string."
-            )
-        normalized.append(member)
-    if len(set(normalized)) != len(normalized):
+    if not all(isinstance(member, str) and member for member in members):
+        for index, member in enumerate(members):
+            if not isinstance(member, str) or not member:
+                raise SystemExit(
+                    f"Team metadata is corrupted for team '{team_name}': members[{index}] must be a non-empty string."
+                )
+    normalized = list(members)
+    member_set = frozenset(normalized)
+    if len(member_set) != len(normalized):
         raise SystemExit(
             f"Team metadata is corrupted for team '{team_name}': duplicate members are not allowed."
         )
-    return normalized
+    roster = (normalized, member_set)
+    TEAM_ROSTER_CACHE[team_name] = (payload, roster)
+    return roster
 
 
 def suggest_closest(value: str, candidates: list[str]) -> str | None:
     if not value or not candidates:
         return None
+    import difflib
+
     matches = difflib.get_close_matches(value, candidates, n=1, cutoff=0.6)
     if not matches:
         return None
@@ -387,8 +604,8 @@ def suggest_closest(value: str, candidates: list[str]) -> str | None:
 
 
 def ensure_registered_member(*, team_name: str, member: str, field_name: str) -> None:
-    members = load_team_members(team_name)
-    if member not in set(members):
+    members, member_set = load_team_roster(team_name)
+    if member not in member_set:
         suggestion = suggest_closest(member, members)
         suggestion_hint = f" Did you mean '{suggestion}'?" if suggestion else ""
         raise SystemExit(
@@ -398,8 +615,7 @@ def ensure_registered_member(*, team_name: str, member: str, field_name: str) ->
 
 
 def ensure_registered_member_list(*, team_name: str, members: list[str], field_name: str) -> None:
-    registered_members = load_team_members(team_name)
-    team_members = set(registered_members)
+    registered_members, team_members = load_team_roster(team_name)
     unknown = sorted({member for member in members if member not in team_members})
     if unknown:
         unknown_with_hints: list[str] = []
@@ -423,8 +639,7 @@ def resolve_new_debate_decider(
     debate_members: list[str],
     field_name: str,
 ) -> str:
-    registered_members = load_team_members(team_name)
-    registered_set = set(registered_members)
+    registered_members, registered_set = load_team_roster(team_name)
 
     if requested_decider in registered_set and requested_decider in debate_members:
         return requested_decider
@@ -468,8 +683,7 @@ def resolve_notify_sender(
     if not required:
         return requested_sender
 
-    members = load_team_members(team_name)
-    member_set = set(members)
+    members, member_set = load_team_roster(team_name)
     if requested_sender in member_set:
         return requested_sender
 
@@ -490,18 +704,21 @@ def resolve_notify_sender(
 
 
 def load_json(path: Path, default: object) -> object:
-    if not path.exists():
-        return default
-    if path.is_dir():
-        raise SystemExit(f"Invalid state path: {path} is a directory, expected a JSON file.")
     try:
         raw = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return default
     except OSError as exc:
+        # Windows reports a directory as PermissionError, not IsADirectoryError.
+        if path.is_dir():
+            raise SystemExit(
+                f"Invalid state path: {path} is a directory, expected a JSON file."
+            ) from exc
         raise SystemExit(
             f"Unable to read JSON file at {path}: {exc.strerror or exc}."
         ) from exc
     try:
-        return json.loads(raw, parse_constant=reject_nonstandard_json_number)
+        return JSON_DECODER.decode(raw)
     except (json.JSONDecodeError, ValueError) as exc:
         raise SystemExit(
             f"Invalid JSON in {path}. Fix the file or run init --reset for a clean state."
@@ -509,24 +726,29 @@ def load_json(path: Path, default: object) -> object:
 
 
 def write_text_file(path: Path, content: str, *, label: str) -> None:
+    write_bytes_file(path, content.encode("utf-8"), label=label)
+
+
+def write_bytes_file(path: Path, data: bytes, *, label: str) -> None:
+    close_append_handles(path)
+    TEAM_STATE_CACHE.pop(os.fspath(path), None)
     temp_path: Path | None = None
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
         if path.exists() and path.is_dir():
             raise SystemExit(f"Cannot write {label}: {path} is a directory, expected a file.")
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            dir=str(path.parent),
-            prefix=f".{path.name}.",
-            suffix=".tmp",
-            delete=False,
-        ) as handle:
-            handle.write(content)
-            handle.flush()
-            os.fsync(handle.fileno())
-            temp_path = Path(handle.name)
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.{time.monotonic_ns():x}.tmp")
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if is_durable_write_enabled():
+                os.fsync(fd)
+        finally:
+            os.close(fd)
         os.replace(temp_path, path)
+        temp_path = None
     except OSError as exc:
         raise SystemExit(
             f"Unable to write {label} at {path}: {exc.strerror or exc}."
@@ -539,26 +761,82 @@ def write_text_file(path: Path, content: str, *, label: str) -> None:
                 pass
 
 
-def read_text_file(path: Path, *, label: str) -> str:
+@contextlib.contextmanager
+def mapped_file(path: Path, *, label: str) -> object:
     if path.is_dir():
         raise SystemExit(f"Invalid {label} path: {path} is a directory, expected a file.")
     try:
-        return path.read_text(encoding="utf-8")
+        with path.open("rb") as handle:
+            # mmap rejects zero-length files; an empty log has no lines anyway.
+            if os.fstat(handle.fileno()).st_size == 0:
+                mapped = None
+            else:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
     except OSError as exc:
         raise SystemExit(
             f"Unable to read {label} at {path}: {exc.strerror or exc}."
         ) from exc
-
-
-def write_json(path: Path, payload: object) -> None:
+    if mapped is None:
+        yield b""
+        return
+    try:
+        yield mapped
+    finally:
+        mapped.close()
+
+
+def iter_mapped_lines(data: object) -> object:
+    start = 0
+    end = len(data)
+    while start < end:
+        newline = data.find(b"\n", start)
+        if newline == -1:
+            newline = end
+        yield data[start:newline]
+        start = newline + 1
+
+
+def iter_candidate_lines(data: object, needles: tuple[bytes, ...]) -> object:
+    """Yield lines containing any needle, or every line if some line is not shaped like {...}.
+
+    Needle-free {...} lines are never yielded, so a caller cannot count malformed
+    ones among them; callers that report invalid lines see only candidates and
+    lines that fail the shape check.
+    """
+    end = len(data)
+    if end and (
+        data[:1] != b"{"
+        or data[end - 2 : end] != b"}\n"
+        or LINE_NOT_OBJECT_PATTERN.search(data) is not None
+    ):
+        yield from iter_mapped_lines(data)
+        return
+    starts: set[int] = set()
+    for needle in needles:
+        hit = data.find(needle)
+        while hit != -1:
+            line_start = data.rfind(b"\n", 0, hit) + 1
+            line_end = data.find(b"\n", hit)
+            starts.add(line_start)
+            hit = data.find(needle, line_end)
+    for line_start in sorted(starts):
+        yield data[line_start : data.find(b"\n", line_start)]
+
+
+def write_json(path: Path, payload: object, *, pretty: bool = False) -> None:
+    encoder = PRETTY_JSON_ENCODER if pretty else STATE_JSON_ENCODER
     try:
-        serialized = json.dumps(payload, indent=2, ensure_ascii=False, allow_nan=False)
+        serialized = encoder.encode(payload).encode("utf-8")
     except (TypeError, ValueError) as exc:
         raise SystemExit(f"Unable to serialize JSON payload for {path}: {exc}.") from exc
-    write_text_file(path, serialized, label="JSON file")
+    write_bytes_file(path, serialized, label="JSON file")
 
 
-def append_jsonl(path: Path, payload: dict[str, object]) -> None:
+def append_handle(path: Path) -> object:
+    key = os.fspath(path)
+    handle = APPEND_HANDLES.get(key)
+    if handle is not None:
+        return handle
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
     except OSError as exc:
@@ -568,26 +846,69 @@ def append_jsonl(path: Path, payload: dict[str, object]) -> None:
     if path.exists() and path.is_dir():
         raise SystemExit(f"Cannot append JSONL: {path} is a directory, expected a file.")
     try:
-        serialized = json.dumps(payload, ensure_ascii=False, allow_nan=False)
+        handle = path.open("ab")
+    except OSError as exc:
+        raise SystemExit(
+            f"Unable to append JSONL at {path}: {exc.strerror or exc}."
+        ) from exc
+    APPEND_HANDLES[key] = handle
+    return handle
+
+
+def close_append_handles(path: Path | None = None) -> None:
+    keys = [os.fspath(path)] if path is not None else list(APPEND_HANDLES)
+    for key in keys:
+        handle = APPEND_HANDLES.pop(key, None)
+        if handle is None:
+            continue
+        try:
+            handle.close()
+        except OSError:
+            pass
+
+
+atexit.register(close_append_handles)
+
+
+def append_jsonl(path: Path, payload: dict[str, object]) -> None:
+    append_jsonl_many(path, [payload])
+
+
+def append_jsonl_many(path: Path, payloads: list[dict[str, object]]) -> None:
+    if not payloads:
+        return
+    try:
+        serialized = "".join(
+            JSONL_ENCODER.encode(payload) + "\n" for payload in payloads
+        ).encode("utf-8")
     except (TypeError, ValueError) as exc:
         raise SystemExit(f"Unable to serialize JSONL payload for {path}: {exc}.") from exc
+    handle = append_handle(path)
     try:
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(serialized + "\n")
+        handle.write(serialized)
+        handle.flush()
     except OSError as exc:
+        close_append_handles(path)
         raise SystemExit(
             f"Unable to append JSONL at {path}: {exc.strerror or exc}."
         ) from exc
 
 
 def remove_state_path(path: Path, *, label: str) -> None:
-    if not path.exists() and not path.is_symlink():
+    # The path may be a directory holding logs we still have open.
+    close_append_handles()
+    TEAM_STATE_CACHE.clear()
+    try:
+        # lstat so dangling symlinks are cleared too.
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
         return
+    except OSError as exc:
+        raise SystemExit(
+            f"Unable to clear {label} at {path}: {exc.strerror or exc}."
+        ) from exc
     try:
-        if path.is_symlink() or path.is_file():
-            path.unlink()
-            return
-        if path.is_dir():
+        if stat.S_ISDIR(mode):
             shutil.rmtree(path)
             return
         path.unlink()
@@ -601,12 +922,31 @@ def reject_nonstandard_json_number(value: str) -> None:
     raise ValueError(f"Invalid JSON numeric constant '{value}'.")
 
 
+JSON_DECODER = json.JSONDecoder(parse_constant=reject_nonstandard_json_number)
+# State files are stored compact (documented in SKILL.md); reports stay indented.
+STATE_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+PRETTY_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, allow_nan=False)
+JSONL_ENCODER = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+
 def env_flag_true(name: str) -> bool:
-    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+    value = os.getenv(name)
+    return bool(value) and value.strip().lower() in TRUTHY_ENV_VALUES
+
+
+def is_durable_write_enabled() -> bool:
+    # os.replace keeps writes atomic either way; fsync only adds crash durability.
+    value = os.getenv(DURABLE_ENV)
+    return not value or value.strip().lower() not in FALSY_ENV_VALUES
 
 
 def is_monitoring_enabled(args: argparse.Namespace) -> bool:
-    return bool(getattr(args, "monitoring", False) or env_flag_true(MONITORING_ENV))
+    enabled = getattr(args, "_monitoring_enabled", None)
+    if enabled is None:
+        enabled = args._monitoring_enabled = bool(
+            getattr(args, "monitoring", False) or env_flag_true(MONITORING_ENV)
+        )
+    return enabled
 
 
 def resolve_monitor_path(args: argparse.Namespace, team_name: str) -> Path:
@@ -616,6 +956,15 @@ def resolve_monitor_path(args: argparse.Namespace, team_name: str) -> Path:
     return monitor_file(team_name)
 
 
+def correlation_id(args: argparse.Namespace) -> str:
+    value = getattr(args, "_correlation_id", None)
+    if not value:
+        import uuid
+
+        value = args._correlation_id = uuid.uuid4().hex
+    return value
+
+
 def log_event(
     args: argparse.Namespace,
     *,
@@ -628,11 +977,12 @@ def log_event(
     before: dict[str, object] | None = None,
     after: dict[str, object] | None = None,
     metadata: dict[str, object] | None = None,
+    at: str | None = None,
 ) -> None:
     if not is_monitoring_enabled(args):
         return
     payload = {
-        "at": utc_now(),
+        "at": at or utc_now(),
         "event_type": event_type,
         "command": command,
         "team_name": team_name,
@@ -642,9 +992,21 @@ def log_event(
         "before": before,
         "after": after,
         "metadata": metadata or {},
-        "correlation_id": getattr(args, "_correlation_id", uuid.uuid4().hex),
+        "correlation_id": correlation_id(args),
     }
-    append_jsonl(resolve_monitor_path(args, team_name), payload)
+    buffer = getattr(args, "_event_buffer", None)
+    if buffer is None:
+        buffer = args._event_buffer = {}
+    buffer.setdefault(resolve_monitor_path(args, team_name), []).append(payload)
+
+
+def flush_events(args: argparse.Namespace) -> None:
+    buffer = getattr(args, "_event_buffer", None)
+    if not buffer:
+        return
+    args._event_buffer = {}
+    for path, payloads in buffer.items():
+        append_jsonl_many(path, payloads)
 
 
 def load_task_board(team_name: str) -> dict[str, object]:
@@ -657,11 +1019,12 @@ def load_task_board(team_name: str) -> dict[str, object]:
         raise SystemExit(
             f"Task board is corrupted for team '{team_name}': 'tasks' must be a JSON array."
         )
-    for index, task in enumerate(tasks):
-        if not isinstance(task, dict):
-            raise SystemExit(
-                f"Task board is corrupted for team '{team_name}': tasks[{index}] must be an object."
-            )
+    if not all(isinstance(task, dict) for task in tasks):
+        for index, task in enumerate(tasks):
+            if not isinstance(task, dict):
+                raise SystemExit(
+                    f"Task board is corrupted for team '{team_name}': tasks[{index}] must be an object."
+                )
 
     next_id = board.get("next_id")
     if not isinstance(next_id, int) or next_id < 1:
@@ -675,7 +1038,7 @@ def load_task_board(team_name: str) -> dict[str, object]:
                 max_id = max(max_id, int(suffix))
         next_id = max_id + 1 if max_id else 1
 
-    return {"tasks": tasks, "next_id": next_id}
+    return {"tasks": tasks, "next_id": next_id, "_index": build_id_index(tasks)}
 
 
 def load_debate_board(team_name: str) -> dict[str, object]:
@@ -690,11 +1053,12 @@ def load_debate_board(team_name: str) -> dict[str, object]:
         raise SystemExit(
             f"Debate board is corrupted for team '{team_name}': 'debates' must be a JSON array."
         )
-    for index, debate in enumerate(debates):
-        if not isinstance(debate, dict):
-            raise SystemExit(
-                f"Debate board is corrupted for team '{team_name}': debates[{index}] must be an object."
-            )
+    if not all(isinstance(debate, dict) for debate in debates):
+        for index, debate in enumerate(debates):
+            if not isinstance(debate, dict):
+                raise SystemExit(
+                    f"Debate board is corrupted for team '{team_name}': debates[{index}] must be an object."
+                )
 
     next_id = board.get("next_id")
     if not isinstance(next_id, int) or next_id < 1:
@@ -708,22 +1072,45 @@ def load_debate_board(team_name: str) -> dict[str, object]:
                 max_id = max(max_id, int(suffix))
         next_id = max_id + 1 if max_id else 1
 
-    return {"debates": debates, "next_id": next_id}
+    return {"debates": debates, "next_id": next_id, "_index": build_id_index(debates)}
+
+
+def build_id_index(items: list[dict[str, object]]) -> dict[str, dict[str, object]]:
+    # First occurrence wins, matching the order a linear scan would see.
+    index: dict[str, dict[str, object]] = {}
+    for item in items:
+        item_id = item.get("id")
+        if isinstance(item_id, str) and item_id and item_id not in index:
+            index[item_id] = item
+    return index
+
+
+def board_index(board: dict[str, object], key: str) -> dict[str, dict[str, object]]:
+    index = board.get("_index")
+    if not isinstance(index, dict):
+        items = board.get(key, [])
+        index = build_id_index([item for item in items if isinstance(item, dict)])
+        board["_index"] = index
+    return index
+
+
+def save_task_board(team_name: str, board: dict[str, object]) -> None:
+    write_json(task_file(team_name), {"tasks": board["tasks"], "next_id": board["next_id"]})
+
+
+def save_debate_board(team_name: str, board: dict[str, object]) -> None:
+    write_json(
+        debate_file(team_name),
+        {"debates": board["debates"], "next_id": board["next_id"]},
+    )
 
 
 def find_task(board: dict[str, object], task_id: str) -> dict[str, object]:
-    tasks = board.get("tasks", [])
-    if not isinstance(tasks, list):
-        raise SystemExit("Task board is corrupted: 'tasks' must be a JSON array.")
-    known_ids: list[str] = []
-    for task in tasks:
-        if not isinstance(task, dict):
-            continue
-        tid = task.get("id")
-        if isinstance(tid, str) and tid:
-            known_ids.append(tid)
-            if tid == task_id:
-                return task
+    index = board_index(board, "tasks")
+    task = index.get(task_id)
+    if task is not None:
+        return task
+    known_ids = list(index)
     suggestion = suggest_closest(task_id, known_ids)
     suggestion_hint = f" Did you mean '{suggestion}'?" if suggestion else ""
     known_text = ", ".join(known_ids) if known_ids else "(none)"
@@ -731,18 +1118,11 @@ def find_task(board: dict[str, object], task_id: str) -> dict[str, object]:
 
 
 def find_debate(board: dict[str, object], debate_id: str) -> dict[str, object]:
-    debates = board.get("debates", [])
-    if not isinstance(debates, list):
-        raise SystemExit("Debate board is corrupted: 'debates' must be a JSON array.")
-    known_ids: list[str] = []
-    for debate in debates:
-        if not isinstance(debate, dict):
-            continue
-        did = debate.get("id")
-        if isinstance(did, str) and did:
-            known_ids.append(did)
-            if did == debate_id:
-                return debate
+    index = board_index(board, "debates")
+    debate = index.get(debate_id)
+    if debate is not None:
+        return debate
+    known_ids = list(index)
     suggestion = suggest_closest(debate_id, known_ids)
     suggestion_hint = f" Did you mean '{suggestion}'?" if suggestion else ""
     known_text = ", ".join(known_ids) if known_ids else "(none)"
@@ -763,6 +1143,11 @@ def latest_positions(debate: dict[str, object]) -> dict[str, dict[str, object]]:
     return latest
 
 
+def missing_members(members: list[str], latest: dict[str, dict[str, object]]) -> list[str]:
+    # Output follows the order of the debate's member list.
+    return [member for member in dict.fromkeys(members) if member not in latest]
+
+
 def choose_decision(
     debate: dict[str, object],
 ) -> tuple[str, str, dict[str, float], dict[str, dict[str, object]]]:
@@ -774,32 +1159,37 @@ def choose_decision(
         field_name="options",
         context=f"Debate {debate_id}",
     )
-    option_set = {opt for opt in options}
-    if not option_set:
+    scores = dict.fromkeys(options, 0.0)
+    if not scores:
         raise SystemExit("Debate has no options to decide from.")
 
     latest = latest_positions(debate)
     if not latest:
         raise SystemExit("No positions submitted yet; cannot decide debate.")
 
-    scores = {opt: 0.0 for opt in option_set}
     for position in latest.values():
         option = position.get("option")
-        if option not in option_set:
+        if option not in scores:
             continue
         confidence = position.get("confidence", 1.0)
         if not isinstance(confidence, (int, float)):
             confidence = 1.0
         scores[str(option)] += float(confidence)
 
-    if not any(score > 0 for score in scores.values()):
+    max_score = -math.inf
+    winners: list[str] = []
+    for opt, score in scores.items():
+        if score > max_score:
+            max_score = score
+            winners = [opt]
+        elif score == max_score:
+            winners.append(opt)
+    if max_score <= 0:
         raise SystemExit("All position scores are zero; cannot auto-decide.")
 
-    max_score = max(scores.values())
-    winners = sorted([opt for opt, score in scores.items() if score == max_score])
-
     if len(winners) == 1:
         return winners[0], "score", scores, latest
+    winners.sort()
 
     decider = debate.get("decider")
     if isinstance(decider, str) and decider in latest:
@@ -812,20 +1202,19 @@ def choose_decision(
 
 def ensure_valid_task_status(status: str) -> None:
     if status not in TASK_STATUSES:
-        raise SystemExit(f"status must be one of: {', '.join(sorted(TASK_STATUSES))}")
+        raise SystemExit(f"status must be one of: {TASK_STATUS_CHOICES}")
 
 
 def require_string_list(value: object, *, field_name: str, context: str) -> list[str]:
     if not isinstance(value, list):
         raise SystemExit(f"{context} is corrupted: '{field_name}' must be a JSON array.")
-    output: list[str] = []
-    for index, item in enumerate(value):
-        if not isinstance(item, str) or not item:
-            raise SystemExit(
-                f"{context} is corrupted: {field_name}[{index}] must be a non-empty string."
-            )
-        output.append(item)
-    return output
+    if not all(isinstance(item, str) and item for item in value):
+        for index, item in enumerate(value):
+            if not isinstance(item, str) or not item:
+                raise SystemExit(
+                    f"{context} is corrupted: {field_name}[{index}] must be a non-empty string."
+                )
+    return list(value)
 
 
 def validate_owner_map(
@@ -874,7 +1263,7 @@ def create_debate(
     options: list[str],
     members: list[str],
     decider: str,
-) -> dict[str, object]:
+) -> tuple[dict[str, object], dict[str, object]]:
     normalized_options = sorted(set(options))
     normalized_members = sorted(set(members))
     normalized_task_id = task_id.strip() if isinstance(task_id, str) else ""
@@ -893,6 +1282,7 @@ def create_debate(
 
     board = load_debate_board(team_name)
     debate_id = f"debate-{board['next_id']}"
+    now = utc_now()
     debate = {
         "id": debate_id,
         "topic": topic,
@@ -904,18 +1294,66 @@ def create_debate(
         "positions": [],
         "decision": None,
         "applied": None,
-        "created_at": utc_now(),
-        "updated_at": utc_now(),
+        "created_at": now,
+        "updated_at": now,
     }
-    debates = board.get("debates")
-    if not isinstance(debates, list):
-        raise SystemExit(
-            f"Debate board is corrupted for team '{team_name}': 'debates' must be a JSON array."
-        )
-    debates.append(debate)
+    board["debates"].append(debate)
+    board_index(board, "debates").setdefault(debate_id, debate)
     board["next_id"] += 1
-    write_json(debate_file(team_name), board)
-    return debate
+    save_debate_board(team_name, board)
+    return board, debate
+
+
+def record_decision(
+    args: argparse.Namespace,
+    *,
+    command: str,
+    debate: dict[str, object],
+    decider: str,
+    selected: str,
+    method: str,
+    scores: dict[str, float],
+    rationale: str,
+) -> dict[str, object]:
+    now = utc_now()
+    decision = {
+        "at": now,
+        "decider": decider,
+        "option": selected,
+        "method": method,
+        "scores": scores,
+        "rationale": rationale,
+    }
+    debate["decision"] = decision
+    debate["status"] = "decided"
+    debate["updated_at"] = now
+    log_event(
+        args,
+        at=now,
+        team_name=args.team_name,
+        event_type="debate.decided",
+        command=command,
+        actor=decider,
+        entity_type="debate",
+        entity_id=str(debate.get("id")),
+        after={
+            "option": selected,
+            "method": method,
+            "status": "decided",
+            "scores": scores,
+        },
+        metadata={"rationale": rationale},
+    )
+    return decision
+
+
+def task_snapshot(task: dict[str, object], *, depends_on: bool = False) -> dict[str, object]:
+    snapshot = {"owner": task.get("owner"), "status": task.get("status")}
+    if depends_on:
+        snapshot["depends_on"] = task.get("depends_on")
+    notes = task.get("notes")
+    snapshot["notes_len"] = len(notes) if isinstance(notes, list) else 0
+    return snapshot
 
 
 def apply_decision_to_task(
@@ -939,11 +1377,8 @@ def apply_decision_to_task(
     ensure_valid_task_status(selected_status)
     task_board = load_task_board(team_name)
     task = find_task(task_board, task_id)
-    before_task = {
-        "owner": task.get("owner"),
-        "status": task.get("status"),
-        "notes_len": len(task.get("notes", [])) if isinstance(task.get("notes"), list) else 0,
-    }
+    monitoring = is_monitoring_enabled(args)
+    before_task = task_snapshot(task) if monitoring else None
 
     owner = owner_map.get(selected_option)
     if owner:
@@ -963,25 +1398,26 @@ def apply_decision_to_task(
     note_text = f"Debate {debate.get('id')} chose '{selected_option}'."
     if rationale:
         note_text = f"{note_text} Rationale: {rationale}"
-    notes.append({"at": utc_now(), "text": note_text})
-    task["updated_at"] = utc_now()
-    write_json(task_file(team_name), task_board)
+    now = utc_now()
+    notes.append({"at": now, "text": note_text})
+    task["updated_at"] = now
+    save_task_board(team_name, task_board)
 
     debate["status"] = "applied"
     debate["applied"] = {
-        "at": utc_now(),
+        "at": now,
         "by": applied_by,
         "task_id": task_id,
         "status": selected_status,
         "owner": task.get("owner"),
         "option": selected_option,
     }
-    debate["updated_at"] = utc_now()
+    debate["updated_at"] = now
 
     append_jsonl(
         message_file(team_name),
         {
-            "at": utc_now(),
+            "at": now,
             "type": "broadcast",
             "from": sender,
             "to": "*",
@@ -991,13 +1427,10 @@ def apply_decision_to_task(
             ),
         },
     )
-    after_task = {
-        "owner": task.get("owner"),
-        "status": task.get("status"),
-        "notes_len": len(task.get("notes", [])) if isinstance(task.get("notes"), list) else 0,
-    }
+    after_task = task_snapshot(task) if monitoring else None
     log_event(
         args,
+        at=now,
         team_name=team_name,
         event_type="debate.applied",
         command="apply-decision",
@@ -1017,6 +1450,18 @@ def apply_decision_to_task(
     return f"Applied decision to {task_id} (status={selected_status}, owner={task.get('owner')})"
 
 
+def scan_team_dir(tdir: Path) -> dict[str, os.DirEntry]:
+    try:
+        with os.scandir(tdir) as entries:
+            return {entry.name: entry for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+    except OSError as exc:
+        raise SystemExit(
+            f"Unable to inspect team directory at {tdir}: {exc.strerror or exc}."
+        ) from exc
+
+
 def cmd_init(args: argparse.Namespace) -> None:
     members = [m.strip() for m in args.members.split(",") if m.strip()]
     if not members:
@@ -1025,9 +1470,11 @@ def cmd_init(args: argparse.Namespace) -> None:
         raise SystemExit("--members must not contain duplicates.")
     tdir = team_dir(args.team_name)
     team_path_conflict = tdir.exists() and not tdir.is_dir()
-    team_meta_path = team_file(args.team_name)
-    team_meta_exists = team_meta_path.exists() or team_meta_path.is_symlink()
-    team_meta_usable = team_meta_path.is_file()
+    # DirEntry includes dangling symlinks, like lstat would.
+    entries = scan_team_dir(tdir)
+    team_meta_entry = entries.get(team_file(args.team_name).name)
+    team_meta_exists = team_meta_entry is not None
+    team_meta_usable = team_meta_exists and team_meta_entry.is_file()
     team_meta_corrupted = False
     if team_meta_usable:
         try:
@@ -1036,7 +1483,7 @@ def cmd_init(args: argparse.Namespace) -> None:
             team_meta_corrupted = True
             team_meta_usable = False
     sidecar_state_exists = any(
-        path.exists() or path.is_symlink()
+        path.name in entries
         for path in (
             task_file(args.team_name),
             debate_file(args.team_name),
@@ -1078,11 +1525,12 @@ def cmd_init(args: argparse.Namespace) -> None:
         raise SystemExit(
             f"Unable to prepare team directory at {tdir}: {exc.strerror or exc}."
         ) from exc
+    now = utc_now()
     team_payload = {
         "team_name": args.team_name,
         "goal": args.goal,
         "members": members,
-        "created_at": utc_now(),
+        "created_at": now,
     }
     write_json(team_file(args.team_name), team_payload)
     write_json(task_file(args.team_name), {"tasks": [], "next_id": 1})
@@ -1100,6 +1548,7 @@ def cmd_init(args: argparse.Namespace) -> None:
         init_command = "init (recovery)"
     log_event(
         args,
+        at=now,
         team_name=args.team_name,
         event_type=init_event,
         command=init_command,
@@ -1124,7 +1573,7 @@ def cmd_init(args: argparse.Namespace) -> None:
 def cmd_add_task(args: argparse.Namespace) -> None:
     require_team(args.team_name)
     if args.status not in TASK_STATUSES:
-        raise SystemExit(f"--status must be one of: {', '.join(sorted(TASK_STATUSES))}")
+        raise SystemExit(f"--status must be one of: {TASK_STATUS_CHOICES}")
     if args.owner != UNASSIGNED_OWNER:
         ensure_registered_member(
             team_name=args.team_name,
@@ -1134,6 +1583,7 @@ def cmd_add_task(args: argparse.Namespace) -> None:
     board = load_task_board(args.team_name)
     task_id = f"task-{board['next_id']}"
     depends_on = [d.strip() for d in (args.depends_on or "").split(",") if d.strip()]
+    now = utc_now()
     task = {
         "id": task_id,
         "title": args.title,
@@ -1141,19 +1591,16 @@ def cmd_add_task(args: argparse.Namespace) -> None:
         "status": args.status,
         "depends_on": depends_on,
         "notes": [],
-        "created_at": utc_now(),
-        "updated_at": utc_now(),
+        "created_at": now,
+        "updated_at": now,
     }
-    tasks = board.get("tasks")
-    if not isinstance(tasks, list):
-        raise SystemExit(
-            f"Task board is corrupted for team '{args.team_name}': 'tasks' must be a JSON array."
-        )
-    tasks.append(task)
+    board["tasks"].append(task)
+    board_index(board, "tasks").setdefault(task_id, task)
     board["next_id"] += 1
-    write_json(task_file(args.team_name), board)
+    save_task_board(args.team_name, board)
     log_event(
         args,
+        at=now,
         team_name=args.team_name,
         event_type="task.created",
         command="add-task",
@@ -1178,12 +1625,14 @@ def cmd_claim(args: argparse.Namespace) -> None:
     if status == "completed":
         raise SystemExit(f"Cannot claim completed task: {args.task_id}")
     before = {"owner": task.get("owner"), "status": task.get("status")}
+    now = utc_now()
     task["owner"] = args.member
     task["status"] = "in_progress"
-    task["updated_at"] = utc_now()
-    write_json(task_file(args.team_name), board)
+    task["updated_at"] = now
+    save_task_board(args.team_name, board)
     log_event(
         args,
+        at=now,
         team_name=args.team_name,
         event_type="task.claimed",
         command="claim",
@@ -1208,12 +1657,9 @@ def cmd_update_task(args: argparse.Namespace) -> None:
         )
     board = load_task_board(args.team_name)
     task = find_task(board, args.task_id)
-    before = {
-        "owner": task.get("owner"),
-        "status": task.get("status"),
-        "depends_on": task.get("depends_on"),
-        "notes_len": len(task.get("notes", [])) if isinstance(task.get("notes"), list) else 0,
-    }
+    monitoring = is_monitoring_enabled(args)
+    before = task_snapshot(task, depends_on=True) if monitoring else None
+    now = utc_now()
     if args.status:
         task["status"] = args.status
     if args.owner:
@@ -1223,13 +1669,14 @@ def cmd_update_task(args: argparse.Namespace) -> None:
         if not isinstance(notes, list):
             notes = []
             task["notes"] = notes
-        notes.append({"at": utc_now(), "text": args.note})
+        notes.append({"at": now, "text": args.note})
     if args.depends_on is not None:
         task["depends_on"] = [d.strip() for d in args.depends_on.split(",") if d.strip()]
-    task["updated_at"] = utc_now()
-    write_json(task_file(args.team_name), board)
+    task["updated_at"] = now
+    save_task_board(args.team_name, board)
     log_event(
         args,
+        at=now,
         team_name=args.team_name,
         event_type="task.updated",
         command="update-task",
@@ -1237,12 +1684,7 @@ def cmd_update_task(args: argparse.Namespace) -> None:
         entity_type="task",
         entity_id=args.task_id,
         before=before,
-        after={
-            "owner": task.get("owner"),
-            "status": task.get("status"),
-            "depends_on": task.get("depends_on"),
-            "notes_len": len(task.get("notes", [])) if isinstance(task.get("notes"), list) else 0,
-        },
+        after=task_snapshot(task, depends_on=True) if monitoring else None,
         metadata={"note_added": bool(args.note)},
     )
     print(f"Updated {args.task_id}")
@@ -1251,19 +1693,12 @@ def cmd_update_task(args: argparse.Namespace) -> None:
 def cmd_list_tasks(args: argparse.Namespace) -> None:
     require_team(args.team_name)
     board = load_task_board(args.team_name)
-    tasks = board.get("tasks", [])
-    if not isinstance(tasks, list):
-        raise SystemExit(
-            f"Task board is corrupted for team '{args.team_name}': 'tasks' must be a JSON array."
-        )
+    tasks = board["tasks"]
     if not tasks:
         print("No tasks.")
         return
+    lines: list[str] = []
     for index, task in enumerate(tasks):
-        if not isinstance(task, dict):
-            raise SystemExit(
-                f"Task board is corrupted for team '{args.team_name}': tasks[{index}] must be an object."
-            )
         depends_on = task.get("depends_on", [])
         if not isinstance(depends_on, list):
             raise SystemExit(
@@ -1277,9 +1712,10 @@ def cmd_list_tasks(args: argparse.Namespace) -> None:
                     f"tasks[{index}].depends_on[{dep_index}] must be a non-empty string."
                 )
         deps = ",".join(depends_on) if depends_on else "-"
-        print(
-            f"{task.get('id')}  {task.get('status')}  owner={task.get('owner')}  deps={deps}  {task.get('title')}"
+        lines.append(
+            f"{task.get('id')}  {task.get('status')}  owner={task.get('owner')}  deps={deps}  {task.get('title')}\n"
         )
+    sys.stdout.write("".join(lines))
 
 
 def cmd_message(args: argparse.Namespace) -> None:
@@ -1294,8 +1730,9 @@ def cmd_message(args: argparse.Namespace) -> None:
         member=args.to,
         field_name="--to",
     )
+    now = utc_now()
     payload = {
-        "at": utc_now(),
+        "at": now,
         "type": "direct",
         "from": args.sender,
         "to": args.to,
@@ -1304,6 +1741,7 @@ def cmd_message(args: argparse.Namespace) -> None:
     append_jsonl(message_file(args.team_name), payload)
     log_event(
         args,
+        at=now,
         team_name=args.team_name,
         event_type="message.sent",
         command="message",
@@ -1322,8 +1760,9 @@ def cmd_broadcast(args: argparse.Namespace) -> None:
         member=args.sender,
         field_name="--from",
     )
+    now = utc_now()
     payload = {
-        "at": utc_now(),
+        "at": now,
         "type": "broadcast",
         "from": args.sender,
         "to": "*",
@@ -1332,6 +1771,7 @@ def cmd_broadcast(args: argparse.Namespace) -> None:
     append_jsonl(message_file(args.team_name), payload)
     log_event(
         args,
+        at=now,
         team_name=args.team_name,
         event_type="message.broadcast",
         command="broadcast",
@@ -1354,28 +1794,38 @@ def cmd_inbox(args: argparse.Namespace) -> None:
     if not mfile.exists():
         print("No messages.")
         return
-    lines = read_text_file(
-        mfile,
-        label=f"message log for team '{args.team_name}'",
-    ).splitlines()
+    # {...} lines without the member, a broadcast or an escape are skipped
+    # unparsed; see the inbox note in SKILL.md for what the warning counts.
+    member_token = JSONL_ENCODER.encode(args.member).encode("utf-8")
+    needles = (member_token, b'"broadcast"', b"\\")
     found = False
     invalid_lines = 0
-    for line in lines:
-        if not line.strip():
-            continue
-        try:
-            payload = json.loads(line, parse_constant=reject_nonstandard_json_number)
-        except (json.JSONDecodeError, ValueError):
-            invalid_lines += 1
-            continue
-        if not isinstance(payload, dict):
-            invalid_lines += 1
-            continue
-        mtype = payload.get("type")
-        target = payload.get("to")
-        if mtype == "broadcast" or target == args.member:
-            found = True
-            print(f"[{payload.get('at')}] {payload.get('from')} -> {target}: {payload.get('body')}")
+    with mapped_file(mfile, label=f"message log for team '{args.team_name}'") as data:
+        for line in iter_candidate_lines(data, needles):
+            line = line.strip()
+            if not line:
+                continue
+            if (
+                member_token not in line
+                and b'"broadcast"' not in line
+                and b"\\" not in line
+                and line.startswith(b"{")
+                and line.endswith(b"}")
+            ):
+                continue
+            try:
+                payload = JSON_DECODER.decode(line.decode("utf-8"))
+            except (json.JSONDecodeError, ValueError):
+                invalid_lines += 1
+                continue
+            if not isinstance(payload, dict):
+                invalid_lines += 1
+                continue
+            mtype = payload.get("type")
+            target = payload.get("to")
+            if mtype == "broadcast" or target == args.member:
+                found = True
+                print(f"[{payload.get('at')}] {payload.get('from')} -> {target}: {payload.get('body')}")
     if invalid_lines:
         print(f"Warning: skipped {invalid_lines} invalid message log line(s).")
     if not found:
@@ -1407,7 +1857,7 @@ def cmd_start_debate(args: argparse.Namespace) -> None:
         required=bool(args.notify),
     )
 
-    debate = create_debate(
+    _, debate = create_debate(
         team_name=args.team_name,
         topic=args.topic,
         task_id=args.task_id,
@@ -1416,23 +1866,26 @@ def cmd_start_debate(args: argparse.Namespace) -> None:
         decider=decider,
     )
 
+    now = debate["created_at"]
     if args.notify:
+        notifications: list[dict[str, object]] = []
+        body = (
+            f"Debate {debate['id']} started for topic '{args.topic}'. "
+            f"Submit your position with add-position. Options: {', '.join(debate['options'])}"
+        )
         for member in debate["members"]:
-            append_jsonl(
-                message_file(args.team_name),
+            notifications.append(
                 {
-                    "at": utc_now(),
+                    "at": now,
                     "type": "direct",
                     "from": notify_sender,
                     "to": member,
-                    "body": (
-                        f"Debate {debate['id']} started for topic '{args.topic}'. "
-                        f"Submit your position with add-position. Options: {', '.join(debate['options'])}"
-                    ),
-                },
+                    "body": body,
+                }
             )
             log_event(
                 args,
+                at=now,
                 team_name=args.team_name,
                 event_type="message.sent",
                 command="start-debate",
@@ -1441,9 +1894,11 @@ def cmd_start_debate(args: argparse.Namespace) -> None:
                 entity_id=f"{notify_sender}->{member}",
                 metadata={"debate_id": debate["id"], "topic": args.topic},
             )
+        append_jsonl_many(message_file(args.team_name), notifications)
 
     log_event(
         args,
+        at=now,
         team_name=args.team_name,
         event_type="debate.started",
         command="start-debate",
@@ -1508,20 +1963,22 @@ def cmd_add_position(args: argparse.Namespace) -> None:
         positions = []
         debate["positions"] = positions
 
+    now = utc_now()
     positions.append(
         {
-            "at": utc_now(),
+            "at": now,
             "member": args.member,
             "option": args.option,
             "confidence": args.confidence,
             "rationale": args.rationale,
         }
     )
-    debate["updated_at"] = utc_now()
+    debate["updated_at"] = now
 
-    write_json(debate_file(args.team_name), board)
+    save_debate_board(args.team_name, board)
     log_event(
         args,
+        at=now,
         team_name=args.team_name,
         event_type="debate.position_added",
         command="add-position",
@@ -1539,16 +1996,8 @@ def cmd_add_position(args: argparse.Namespace) -> None:
 def cmd_list_debates(args: argparse.Namespace) -> None:
     require_team(args.team_name)
     board = load_debate_board(args.team_name)
-    debates = board.get("debates", [])
-    if not isinstance(debates, list):
-        raise SystemExit(
-            f"Debate board is corrupted for team '{args.team_name}': 'debates' must be a JSON array."
-        )
-
     filtered = []
-    for debate in debates:
-        if not isinstance(debate, dict):
-            continue
+    for debate in board["debates"]:
         status = debate.get("status")
         if args.status and status != args.status:
             continue
@@ -1558,6 +2007,7 @@ def cmd_list_debates(args: argparse.Namespace) -> None:
         print("No debates.")
         return
 
+    lines: list[str] = []
     for debate in filtered:
         debate_id = debate.get("id")
         if not isinstance(debate_id, str) or not debate_id:
@@ -1568,10 +2018,11 @@ def cmd_list_debates(args: argparse.Namespace) -> None:
             context=f"Debate {debate_id}",
         )
         submitted = len(latest_positions(debate))
-        print(
+        lines.append(
             f"{debate.get('id')}  {debate.get('status')}  task={debate.get('task_id') or '-'}  "
-            f"positions={submitted}/{len(members)}  topic={debate.get('topic')}"
+            f"positions={submitted}/{len(members)}  topic={debate.get('topic')}\n"
         )
+    sys.stdout.write("".join(lines))
 
 
 def cmd_show_debate(args: argparse.Namespace) -> None:
@@ -1599,111 +2050,78 @@ def cmd_monitor_report(args: argparse.Namespace) -> None:
             "orchestrate_wait_cycles": 0,
         }
         if args.output:
-            write_json(Path(args.output), payload)
+            write_json(Path(args.output), payload, pretty=True)
         print(json.dumps(payload, ensure_ascii=False))
         return
 
-    events = []
+    events_total = 0
     invalid_lines = 0
     other_team_lines = 0
-    for line in read_text_file(
-        monitor_path,
-        label=f"monitor log for team '{args.team_name}'",
-    ).splitlines():
-        if not line.strip():
-            continue
-        try:
-            payload = json.loads(line, parse_constant=reject_nonstandard_json_number)
-        except (json.JSONDecodeError, ValueError):
-            invalid_lines += 1
-            continue
-        if not isinstance(payload, dict):
-            invalid_lines += 1
-            continue
-        payload_team = payload.get("team_name")
-        if not isinstance(payload_team, str) or not payload_team:
-            invalid_lines += 1
-            continue
-        event_type = payload.get("event_type")
-        command = payload.get("command")
-        actor = payload.get("actor")
-        entity_type = payload.get("entity_type")
-        entity_id = payload.get("entity_id")
-        if not isinstance(event_type, str) or not event_type:
-            invalid_lines += 1
-            continue
-        if not isinstance(command, str) or not command:
-            invalid_lines += 1
-            continue
-        if not isinstance(actor, str) or not actor:
-            invalid_lines += 1
-            continue
-        if not isinstance(entity_type, str) or not entity_type:
-            invalid_lines += 1
-            continue
-        if not isinstance(entity_id, str) or not entity_id:
-            invalid_lines += 1
-            continue
-        at_value = payload.get("at")
-        if not isinstance(at_value, str) or not at_value:
-            invalid_lines += 1
-            continue
-        if parse_iso_datetime(at_value) is None:
-            invalid_lines += 1
-            continue
-        if payload_team != args.team_name:
-            other_team_lines += 1
-            continue
-        events.append(payload)
-
     message_count = 0
     debate_ids: set[str] = set()
     debate_applied_count = 0
     task_reflection_count = 0
     orchestrate_wait_cycles = 0
     start_times: dict[str, datetime] = {}
-    latencies: list[float] = []
-
-    for event in events:
-        etype = event["event_type"]
-        entity_id = event["entity_id"]
-        if etype.startswith("message."):
-            message_count += 1
-        if etype.startswith("debate."):
-            debate_ids.add(entity_id)
-        if etype == "debate.started":
-            debate_ids.add(entity_id)
-            at_raw = event.get("at")
-            if isinstance(at_raw, str):
-                parsed = parse_iso_datetime(at_raw)
-                if parsed is not None:
-                    start_times[entity_id] = parsed
-        if etype == "debate.applied":
-            debate_applied_count += 1
-            task_reflection_count += 1
-            at_raw = event.get("at")
-            if isinstance(at_raw, str) and entity_id in start_times:
-                applied_at = parse_iso_datetime(at_raw)
-                if applied_at is not None:
-                    latencies.append((applied_at - start_times[entity_id]).total_seconds())
-        if etype == "orchestrate.waiting":
-            orchestrate_wait_cycles += 1
+    latency_total = 0.0
+    latency_count = 0
+    with mapped_file(monitor_path, label=f"monitor log for team '{args.team_name}'") as data:
+        for line in iter_mapped_lines(data):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                payload = JSON_DECODER.decode(line.decode("utf-8"))
+            except (json.JSONDecodeError, ValueError):
+                invalid_lines += 1
+                continue
+            if not isinstance(payload, dict):
+                invalid_lines += 1
+                continue
+            values = [payload.get(field) for field in MONITOR_EVENT_FIELDS]
+            if not all(isinstance(value, str) and value for value in values):
+                invalid_lines += 1
+                continue
+            payload_team, event_type, _, _, _, entity_id, at_value = values
+            at_time = parse_iso_datetime(at_value)
+            if at_time is None:
+                invalid_lines += 1
+                continue
+            if payload_team != args.team_name:
+                other_team_lines += 1
+                continue
+
+            events_total += 1
+            if event_type.startswith("message."):
+                message_count += 1
+            if event_type.startswith("debate."):
+                debate_ids.add(entity_id)
+            if event_type == "debate.started":
+                start_times[entity_id] = at_time
+            if event_type == "debate.applied":
+                debate_applied_count += 1
+                task_reflection_count += 1
+                if entity_id in start_times:
+                    latency_total += (at_time - start_times[entity_id]).total_seconds()
+                    latency_count += 1
+            if event_type == "orchestrate.waiting":
+                orchestrate_wait_cycles += 1
 
     payload = {
         "team_name": args.team_name,
         "monitor_file": str(monitor_path),
-        "events_total": len(events),
+        "events_total": events_total,
         "invalid_event_lines": invalid_lines,
         "other_team_event_lines": other_team_lines,
         "message_count": message_count,
         "debate_count": len(debate_ids),
         "debate_applied_count": debate_applied_count,
         "task_reflection_count": task_reflection_count,
-        "reflection_latency_seconds": (sum(latencies) / len(latencies)) if latencies else 0.0,
+        "reflection_latency_seconds": (latency_total / latency_count) if latency_count else 0.0,
         "orchestrate_wait_cycles": orchestrate_wait_cycles,
     }
     if args.output:
-        write_json(Path(args.output), payload)
+        write_json(Path(args.output), payload, pretty=True)
     print(json.dumps(payload, ensure_ascii=False))
 
 
@@ -1729,7 +2147,8 @@ def cmd_decide_debate(args: argparse.Namespace) -> None:
         context=f"Debate {args.debate_id}",
     )
     owner_map: dict[str, str] = {}
-    has_linked_task = bool(isinstance(debate.get("task_id"), str) and debate.get("task_id"))
+    linked_task_id = debate.get("task_id")
+    has_linked_task = isinstance(linked_task_id, str) and bool(linked_task_id)
     if args.apply and has_linked_task:
         owner_map = parse_owner_map(args.owner_map)
         validate_owner_map(
@@ -1790,7 +2209,7 @@ def cmd_decide_debate(args: argparse.Namespace) -> None:
 
         if args.require_all_positions:
             latest = latest_positions(debate)
-            missing = sorted(set(members) - set(latest))
+            missing = missing_members(members, latest)
             if missing:
                 raise SystemExit(
                     "Cannot apply decided debate yet; missing positions from: "
@@ -1819,47 +2238,29 @@ def cmd_decide_debate(args: argparse.Namespace) -> None:
             selected, method, scores, latest = choose_decision(debate)
 
         if args.require_all_positions:
-            missing = sorted(set(members) - set(latest))
+            missing = missing_members(members, latest)
             if missing:
                 raise SystemExit(
                     "Cannot decide yet; missing positions from: " + ", ".join(missing)
                 )
 
-        debate["decision"] = {
-            "at": utc_now(),
-            "decider": effective_decider,
-            "option": selected,
-            "method": method,
-            "scores": scores,
-            "rationale": args.rationale,
-        }
-        debate["status"] = "decided"
-        debate["updated_at"] = utc_now()
-        decision_recorded = True
-        log_event(
+        record_decision(
             args,
-            team_name=args.team_name,
-            event_type="debate.decided",
             command="decide-debate",
-            actor=effective_decider,
-            entity_type="debate",
-            entity_id=args.debate_id,
-            after={
-                "option": selected,
-                "method": method,
-                "status": debate["status"],
-                "scores": scores,
-            },
-            metadata={"rationale": args.rationale},
+            debate=debate,
+            decider=effective_decider,
+            selected=selected,
+            method=method,
+            scores=scores,
+            rationale=args.rationale,
         )
+        decision_recorded = True
 
     apply_note = ""
+    debate_changed = decision_recorded
     if args.apply:
-        will_broadcast_apply = bool(
-            isinstance(debate.get("task_id"), str)
-            and debate.get("task_id")
-            and not debate.get("applied")
-        )
+        will_broadcast_apply = has_linked_task and not debate.get("applied")
+        debate_changed = debate_changed or will_broadcast_apply
         notify_sender = resolve_notify_sender(
             team_name=args.team_name,
             requested_sender=args.notify_from,
@@ -1878,7 +2279,8 @@ def cmd_decide_debate(args: argparse.Namespace) -> None:
             sender=notify_sender,
         )
 
-    write_json(debate_file(args.team_name), board)
+    if debate_changed:
+        save_debate_board(args.team_name, board)
     if decision_recorded:
         print(
             f"Decided {args.debate_id}: option='{selected}' method={method} "
@@ -1897,11 +2299,12 @@ def cmd_orchestrate_debate(args: argparse.Namespace) -> None:
     require_team(args.team_name)
     team_members = load_team_members(args.team_name)
 
-    board = load_debate_board(args.team_name)
     owner_map: dict[str, str] = {}
 
+    board: dict[str, object]
     debate: dict[str, object]
     if args.debate_id:
+        board = load_debate_board(args.team_name)
         debate = find_debate(board, args.debate_id)
     else:
         options = parse_csv(args.options)
@@ -1919,7 +2322,7 @@ def cmd_orchestrate_debate(args: argparse.Namespace) -> None:
             debate_members=members,
             field_name="--decider",
         )
-        debate = create_debate(
+        board, debate = create_debate(
             team_name=args.team_name,
             topic=args.topic,
             task_id=args.task_id,
@@ -1927,22 +2330,21 @@ def cmd_orchestrate_debate(args: argparse.Namespace) -> None:
             members=members,
             decider=decider,
         )
-        board = load_debate_board(args.team_name)
-        debate = find_debate(board, str(debate["id"]))
         log_event(
             args,
+            at=debate["created_at"],
             team_name=args.team_name,
             event_type="debate.started",
             command="orchestrate-debate",
-            actor=str(debate.get("decider") or args.decider or "lead"),
+            actor=decider,
             entity_type="debate",
             entity_id=str(debate["id"]),
             after={
-                "topic": debate.get("topic"),
-                "task_id": debate.get("task_id"),
-                "options": debate.get("options"),
-                "members": debate.get("members"),
-                "status": debate.get("status"),
+                "topic": debate["topic"],
+                "task_id": debate["task_id"],
+                "options": debate["options"],
+                "members": debate["members"],
+                "status": debate["status"],
             },
         )
 
@@ -1972,9 +2374,10 @@ def cmd_orchestrate_debate(args: argparse.Namespace) -> None:
         field_name="--decider",
     )
     latest = latest_positions(debate)
-    missing = sorted(set(members) - set(latest))
+    missing = missing_members(members, latest)
 
     if missing:
+        now = utc_now()
         if args.send_reminders:
             notify_sender = resolve_notify_sender(
                 team_name=args.team_name,
@@ -1983,22 +2386,24 @@ def cmd_orchestrate_debate(args: argparse.Namespace) -> None:
                 reason="orchestrate-debate reminders",
                 required=True,
             )
+            body = (
+                f"Debate {debate_id} is waiting for your position. "
+                f"Run add-position with one of: {', '.join(options)}"
+            )
+            reminders: list[dict[str, object]] = []
             for member in missing:
-                append_jsonl(
-                    message_file(args.team_name),
+                reminders.append(
                     {
-                        "at": utc_now(),
+                        "at": now,
                         "type": "direct",
                         "from": notify_sender,
                         "to": member,
-                        "body": (
-                            f"Debate {debate_id} is waiting for your position. "
-                            f"Run add-position with one of: {', '.join(str(x) for x in debate.get('options', []))}"
-                        ),
-                    },
+                        "body": body,
+                    }
                 )
                 log_event(
                     args,
+                    at=now,
                     team_name=args.team_name,
                     event_type="message.sent",
                     command="orchestrate-debate",
@@ -2007,8 +2412,10 @@ def cmd_orchestrate_debate(args: argparse.Namespace) -> None:
                     entity_id=f"{notify_sender}->{member}",
                     metadata={"debate_id": debate_id, "reason": "missing_position"},
                 )
+            append_jsonl_many(message_file(args.team_name), reminders)
         log_event(
             args,
+            at=now,
             team_name=args.team_name,
             event_type="orchestrate.waiting",
             command="orchestrate-debate",
@@ -2021,29 +2428,19 @@ def cmd_orchestrate_debate(args: argparse.Namespace) -> None:
         return
 
     decision = debate.get("decision")
+    decision_recorded = False
     if not isinstance(decision, dict):
         selected, method, scores, _ = choose_decision(debate)
-        debate["decision"] = {
-            "at": utc_now(),
-            "decider": effective_decider,
-            "option": selected,
-            "method": method,
-            "scores": scores,
-            "rationale": args.auto_rationale,
-        }
-        debate["status"] = "decided"
-        debate["updated_at"] = utc_now()
-        decision = debate["decision"]
-        log_event(
+        decision_recorded = True
+        decision = record_decision(
             args,
-            team_name=args.team_name,
-            event_type="debate.decided",
             command="orchestrate-debate",
-            actor=effective_decider,
-            entity_type="debate",
-            entity_id=debate_id,
-            after={"option": selected, "method": method, "scores": scores, "status": debate["status"]},
-            metadata={"rationale": args.auto_rationale},
+            debate=debate,
+            decider=effective_decider,
+            selected=selected,
+            method=method,
+            scores=scores,
+            rationale=args.auto_rationale,
         )
 
     selected_option = decision.get("option")
@@ -2053,7 +2450,8 @@ def cmd_orchestrate_debate(args: argparse.Namespace) -> None:
             + ", ".join(str(option) for option in options)
         )
 
-    has_linked_task = bool(isinstance(debate.get("task_id"), str) and debate.get("task_id"))
+    linked_task_id = debate.get("task_id")
+    has_linked_task = isinstance(linked_task_id, str) and bool(linked_task_id)
     if has_linked_task:
         owner_map = parse_owner_map(args.owner_map)
         validate_owner_map(
@@ -2063,11 +2461,7 @@ def cmd_orchestrate_debate(args: argparse.Namespace) -> None:
             context=f"Debate {debate_id}",
         )
 
-    will_broadcast_apply = bool(
-        isinstance(debate.get("task_id"), str)
-        and debate.get("task_id")
-        and not debate.get("applied")
-    )
+    will_broadcast_apply = has_linked_task and not debate.get("applied")
     notify_sender = resolve_notify_sender(
         team_name=args.team_name,
         requested_sender=args.notify_from,
@@ -2087,9 +2481,12 @@ def cmd_orchestrate_debate(args: argparse.Namespace) -> None:
         sender=notify_sender,
     )
 
-    write_json(debate_file(args.team_name), board)
+    debate_changed = decision_recorded or will_broadcast_apply
+    if debate_changed:
+        save_debate_board(args.team_name, board)
     log_event(
         args,
+        at=str(debate["updated_at"]) if debate_changed else None,
         team_name=args.team_name,
         event_type="orchestrate.completed",
         command="orchestrate-debate",
@@ -2105,34 +2502,38 @@ def cmd_orchestrate_debate(args: argparse.Namespace) -> None:
     print(apply_note)
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Team operations for codex-agent-teams.")
-    parser.add_argument(
-        "--team-root",
-        help=(
-            "Override team storage root. Defaults to nearest ancestor containing '.codex' "
-            "(or current directory) plus '/.codex/teams'. Can also be set via TEAM_OPS_ROOT."
-        ),
-    )
-    parser.add_argument(
-        "--monitoring",
-        action="store_true",
-        help="Enable monitoring event logging for this command run.",
-    )
-    parser.add_argument(
-        "--monitor-log-file",
-        help=(
-            "Override monitor log path. Default: .codex/teams/<team>/monitor.jsonl. "
-            "Can also be set via TEAM_OPS_MONITOR_LOG_FILE."
-        ),
-    )
-    parser.add_argument(
-        "--correlation-id",
-        help="Optional correlation id for linking events across multiple command invocations.",
+TEAM_ROOT_HELP = (
+    "Override team storage root. Defaults to nearest ancestor containing '.codex' "
+    "(or current directory) plus '/.codex/teams'. Can also be set via TEAM_OPS_ROOT."
+)
+MONITORING_HELP = "Enable monitoring event logging for this command run."
+MONITOR_LOG_FILE_HELP = (
+    "Override monitor log path. Default: .codex/teams/<team>/monitor.jsonl. "
+    "Can also be set via TEAM_OPS_MONITOR_LOG_FILE."
+)
+CORRELATION_ID_HELP = (
+    "Optional correlation id for linking events across multiple command invocations."
+)
+
+
+@functools.lru_cache(maxsize=None)
+def subcommand_global_options() -> argparse.ArgumentParser:
+    """Global flags repeated on every subcommand so they work before or after it."""
+    # SUPPRESS keeps a value given before the subcommand from being reset.
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--team-root", default=argparse.SUPPRESS, help=TEAM_ROOT_HELP)
+    common.add_argument(
+        "--monitoring", action="store_true", default=argparse.SUPPRESS, help=MONITORING_HELP
     )
-    sub = parser.add_subparsers(dest="command", required=True)
+    common.add_argument("--monitor-log-file", default=argparse.SUPPRESS, help=MONITOR_LOG_FILE_HELP)
+    common.add_argument("--correlation-id", default=argparse.SUPPRESS, help=CORRELATION_ID_HELP)
+    return common
 
-    p_init = sub.add_parser("init", help="Initialize a team workspace.")
+
+def add_init_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    p_init = sub.add_parser(
+        "init", help="Initialize a team workspace.", parents=[subcommand_global_options()]
+    )
     p_init.add_argument("--team-name", required=True)
     p_init.add_argument("--goal", required=True)
     p_init.add_argument("--members", required=True, help="Comma-separated members.")
@@ -2142,22 +2543,39 @@ def build_parser() -> argparse.ArgumentParser:
         help="Explicitly reset existing team state (tasks/debates/messages/monitor).",
     )
     p_init.set_defaults(func=cmd_init)
+    return p_init
+
 
-    p_add = sub.add_parser("add-task", help="Add a task to the shared board.")
+def add_add_task_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    p_add = sub.add_parser(
+        "add-task", help="Add a task to the shared board.", parents=[subcommand_global_options()]
+    )
     p_add.add_argument("--team-name", required=True)
     p_add.add_argument("--title", required=True)
     p_add.add_argument("--owner", default="unassigned")
     p_add.add_argument("--status", default="pending")
     p_add.add_argument("--depends-on", default="")
     p_add.set_defaults(func=cmd_add_task)
+    return p_add
+
 
-    p_claim = sub.add_parser("claim", help="Claim a task and mark in progress.")
+def add_claim_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    p_claim = sub.add_parser(
+        "claim", help="Claim a task and mark in progress.", parents=[subcommand_global_options()]
+    )
     p_claim.add_argument("--team-name", required=True)
     p_claim.add_argument("--task-id", required=True)
     p_claim.add_argument("--member", required=True)
     p_claim.set_defaults(func=cmd_claim)
+    return p_claim
 
-    p_update = sub.add_parser("update-task", help="Update task state, owner, deps, notes.")
+
+def add_update_task_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    p_update = sub.add_parser(
+        "update-task",
+        help="Update task state, owner, deps, notes.",
+        parents=[subcommand_global_options()],
+    )
     p_update.add_argument("--team-name", required=True)
     p_update.add_argument("--task-id", required=True)
     p_update.add_argument("--status")
@@ -2165,31 +2583,58 @@ def build_parser() -> argparse.ArgumentParser:
     p_update.add_argument("--depends-on")
     p_update.add_argument("--note")
     p_update.set_defaults(func=cmd_update_task)
+    return p_update
 
-    p_list = sub.add_parser("list-tasks", help="List tasks from the board.")
+
+def add_list_tasks_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    p_list = sub.add_parser(
+        "list-tasks", help="List tasks from the board.", parents=[subcommand_global_options()]
+    )
     p_list.add_argument("--team-name", required=True)
     p_list.set_defaults(func=cmd_list_tasks)
+    return p_list
+
 
-    p_msg = sub.add_parser("message", help="Send direct teammate message.")
+def add_message_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    p_msg = sub.add_parser(
+        "message", help="Send direct teammate message.", parents=[subcommand_global_options()]
+    )
     p_msg.add_argument("--team-name", required=True)
     p_msg.add_argument("--from", dest="sender", required=True)
     p_msg.add_argument("--to", required=True)
     p_msg.add_argument("--body", required=True)
     p_msg.set_defaults(func=cmd_message)
+    return p_msg
+
 
-    p_brd = sub.add_parser("broadcast", help="Send broadcast message to all teammates.")
+def add_broadcast_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    p_brd = sub.add_parser(
+        "broadcast",
+        help="Send broadcast message to all teammates.",
+        parents=[subcommand_global_options()],
+    )
     p_brd.add_argument("--team-name", required=True)
     p_brd.add_argument("--from", dest="sender", required=True)
     p_brd.add_argument("--body", required=True)
     p_brd.set_defaults(func=cmd_broadcast)
+    return p_brd
+
 
-    p_inbox = sub.add_parser("inbox", help="Read a teammate inbox.")
+def add_inbox_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    p_inbox = sub.add_parser(
+        "inbox", help="Read a teammate inbox.", parents=[subcommand_global_options()]
+    )
     p_inbox.add_argument("--team-name", required=True)
     p_inbox.add_argument("--member", required=True)
     p_inbox.set_defaults(func=cmd_inbox)
+    return p_inbox
 
+
+def add_start_debate_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
     p_start_debate = sub.add_parser(
-        "start-debate", help="Create a debate to resolve competing approaches."
+        "start-debate",
+        help="Create a debate to resolve competing approaches.",
+        parents=[subcommand_global_options()],
     )
     p_start_debate.add_argument("--team-name", required=True)
     p_start_debate.add_argument("--topic", required=True)
@@ -2200,9 +2645,14 @@ def build_parser() -> argparse.ArgumentParser:
     p_start_debate.add_argument("--notify", action="store_true")
     p_start_debate.add_argument("--notify-from", default="lead")
     p_start_debate.set_defaults(func=cmd_start_debate)
+    return p_start_debate
 
+
+def add_add_position_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
     p_add_position = sub.add_parser(
-        "add-position", help="Submit a member position for a debate option."
+        "add-position",
+        help="Submit a member position for a debate option.",
+        parents=[subcommand_global_options()],
     )
     p_add_position.add_argument("--team-name", required=True)
     p_add_position.add_argument("--debate-id", required=True)
@@ -2211,24 +2661,46 @@ def build_parser() -> argparse.ArgumentParser:
     p_add_position.add_argument("--confidence", type=float, default=1.0)
     p_add_position.add_argument("--rationale", required=True)
     p_add_position.set_defaults(func=cmd_add_position)
+    return p_add_position
+
 
-    p_list_debates = sub.add_parser("list-debates", help="List debates.")
+def add_list_debates_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    p_list_debates = sub.add_parser(
+        "list-debates", help="List debates.", parents=[subcommand_global_options()]
+    )
     p_list_debates.add_argument("--team-name", required=True)
     p_list_debates.add_argument("--status", choices=sorted(DEBATE_STATUSES))
     p_list_debates.set_defaults(func=cmd_list_debates)
+    return p_list_debates
+
 
-    p_show_debate = sub.add_parser("show-debate", help="Show one debate in JSON.")
+def add_show_debate_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    p_show_debate = sub.add_parser(
+        "show-debate", help="Show one debate in JSON.", parents=[subcommand_global_options()]
+    )
     p_show_debate.add_argument("--team-name", required=True)
     p_show_debate.add_argument("--debate-id", required=True)
     p_show_debate.set_defaults(func=cmd_show_debate)
+    return p_show_debate
 
-    p_monitor = sub.add_parser("monitor-report", help="Summarize monitor events for a team.")
+
+def add_monitor_report_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    p_monitor = sub.add_parser(
+        "monitor-report",
+        help="Summarize monitor events for a team.",
+        parents=[subcommand_global_options()],
+    )
     p_monitor.add_argument("--team-name", required=True)
     p_monitor.add_argument("--output", help="Optional JSON output path.")
     p_monitor.set_defaults(func=cmd_monitor_report)
+    return p_monitor
+
 
+def add_decide_debate_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
     p_decide_debate = sub.add_parser(
-        "decide-debate", help="Finalize debate decision and optionally apply to task."
+        "decide-debate",
+        help="Finalize debate decision and optionally apply to task.",
+        parents=[subcommand_global_options()],
     )
     p_decide_debate.add_argument("--team-name", required=True)
     p_decide_debate.add_argument("--debate-id", required=True)
@@ -2248,13 +2720,17 @@ def build_parser() -> argparse.ArgumentParser:
     p_decide_debate.add_argument("--owner-map", default="")
     p_decide_debate.add_argument("--notify-from", default="lead")
     p_decide_debate.set_defaults(func=cmd_decide_debate)
+    return p_decide_debate
+
 
+def add_orchestrate_debate_parser(sub: argparse._SubParsersAction) -> argparse.ArgumentParser:
     p_orchestrate = sub.add_parser(
         "orchestrate-debate",
         help=(
             "Automatic loop: create or load debate, remind missing members, "
             "auto-decide when ready, and apply decision to linked task."
         ),
+        parents=[subcommand_global_options()],
     )
     p_orchestrate.add_argument("--team-name", required=True)
     p_orchestrate.add_argument("--debate-id")
@@ -2269,53 +2745,108 @@ def build_parser() -> argparse.ArgumentParser:
     p_orchestrate.add_argument("--send-reminders", action="store_true")
     p_orchestrate.add_argument("--notify-from", default="lead")
     p_orchestrate.set_defaults(func=cmd_orchestrate_debate)
-
-    # Allow monitoring flags both before and after subcommand for ergonomic CLI usage.
-    for child in sub.choices.values():
-        if "--team-root" not in child._option_string_actions:
-            child.add_argument(
-                "--team-root",
-                default=argparse.SUPPRESS,
-                help=(
-                    "Override team storage root. Defaults to nearest ancestor containing "
-                    "'.codex' (or current directory) plus '/.codex/teams'. "
-                    "Can also be set via TEAM_OPS_ROOT."
-                ),
-            )
-        if "--monitoring" not in child._option_string_actions:
-            child.add_argument(
-                "--monitoring",
-                action="store_true",
-                default=argparse.SUPPRESS,
-                help="Enable monitoring event logging for this command run.",
-            )
-        if "--monitor-log-file" not in child._option_string_actions:
-            child.add_argument(
-                "--monitor-log-file",
-                default=argparse.SUPPRESS,
-                help=(
-                    "Override monitor log path. Default: .codex/teams/<team>/monitor.jsonl. "
-                    "Can also be set via TEAM_OPS_MONITOR_LOG_FILE."
-                ),
-            )
-        if "--correlation-id" not in child._option_string_actions:
-            child.add_argument(
-                "--correlation-id",
-                default=argparse.SUPPRESS,
-                help="Optional correlation id for linking events across command invocations.",
-            )
+    return p_orchestrate
+
+
+COMMAND_PARSERS = {
+    "init": add_init_parser,
+    "add-task": add_add_task_parser,
+    "claim": add_claim_parser,
+    "update-task": add_update_task_parser,
+    "list-tasks": add_list_tasks_parser,
+    "message": add_message_parser,
+    "broadcast": add_broadcast_parser,
+    "inbox": add_inbox_parser,
+    "start-debate": add_start_debate_parser,
+    "add-position": add_add_position_parser,
+    "list-debates": add_list_debates_parser,
+    "show-debate": add_show_debate_parser,
+    "monitor-report": add_monitor_report_parser,
+    "decide-debate": add_decide_debate_parser,
+    "orchestrate-debate": add_orchestrate_debate_parser,
+}
+MUTATING_COMMANDS = frozenset(
+    {
+        "init",
+        "add-task",
+        "claim",
+        "update-task",
+        "message",
+        "broadcast",
+        "start-debate",
+        "add-position",
+        "decide-debate",
+        "orchestrate-debate",
+    }
+)
+GLOBAL_OPTIONS = ("--help", "--team-root", "--monitoring", "--monitor-log-file", "--correlation-id")
+GLOBAL_VALUE_OPTIONS = frozenset({"--team-root", "--monitor-log-file", "--correlation-id"})
+
+
+def find_command(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, or None when it cannot be told cheaply."""
+    index = 0
+    while index < len(argv):
+        token = argv[index]
+        if token == "--":
+            return None
+        if not token.startswith("-") or token == "-":
+            return token if token in COMMAND_PARSERS else None
+        if token in {"-h", "--help"}:
+            return None
+        if "=" not in token and token.startswith("--"):
+            # argparse accepts unambiguous prefixes of long options.
+            matches = [option for option in GLOBAL_OPTIONS if option.startswith(token)]
+            if token in GLOBAL_OPTIONS:
+                matches = [token]
+            if len(matches) != 1 or matches[0] == "--help":
+                return None
+            if matches[0] in GLOBAL_VALUE_OPTIONS:
+                index += 1
+        index += 1
+    return None
+
+
+class SingleCommandParseError(Exception):
+    pass
+
+
+class SingleCommandParser(argparse.ArgumentParser):
+    def error(self, message: str) -> None:
+        raise SingleCommandParseError(message)
+
+
+@functools.lru_cache(maxsize=None)
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser, registering only `command`'s subparser when given."""
+    parser_class = SingleCommandParser if command in COMMAND_PARSERS else argparse.ArgumentParser
+    parser = parser_class(description="Team operations for codex-agent-teams.")
+    parser.add_argument("--team-root", help=TEAM_ROOT_HELP)
+    parser.add_argument("--monitoring", action="store_true", help=MONITORING_HELP)
+    parser.add_argument("--monitor-log-file", help=MONITOR_LOG_FILE_HELP)
+    parser.add_argument("--correlation-id", help=CORRELATION_ID_HELP)
+    sub = parser.add_subparsers(dest="command", required=True)
+    if command in COMMAND_PARSERS:
+        COMMAND_PARSERS[command](sub)
+    else:
+        for add_parser in COMMAND_PARSERS.values():
+            add_parser(sub)
 
     return parser
 
 
 def main() -> int:
     global TEAM_ROOT, TEAM_ROOT_IS_EXPLICIT
-    parser = build_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    try:
+        args = build_parser(find_command(argv)).parse_args(argv)
+    except SingleCommandParseError:
+        # Report through the full parser so usage lists every subcommand.
+        args = build_parser().parse_args(argv)
     TEAM_ROOT_IS_EXPLICIT = bool(getattr(args, "team_root", None) or os.getenv(TEAM_ROOT_ENV))
     TEAM_ROOT = resolve_team_root(getattr(args, "team_root", None))
     ensure_team_root_usable(TEAM_ROOT)
-    args._correlation_id = args.correlation_id or uuid.uuid4().hex
+    args._correlation_id = args.correlation_id
 
     if args.command == "orchestrate-debate" and not args.debate_id:
         if not args.topic:
@@ -2325,27 +2856,21 @@ def main() -> int:
         if not args.members:
             raise SystemExit("--members is required when --debate-id is not provided.")
 
-    mutating_commands = {
-        "init",
-        "add-task",
-        "claim",
-        "update-task",
-        "message",
-        "broadcast",
-        "start-debate",
-        "add-position",
-        "decide-debate",
-        "orchestrate-debate",
-    }
-    if args.command in mutating_commands:
+    if args.command in MUTATING_COMMANDS:
         # Some commands can auto-switch TEAM_ROOT via require_team(). Resolve that
         # before locking so the lock is taken at the final canonical root.
         if args.command != "init":
             require_team(args.team_name)
         with team_state_lock(args.team_name):
-            args.func(args)
+            try:
+                args.func(args)
+            finally:
+                flush_events(args)
     else:
-        args.func(args)
+        try:
+            args.func(args)
+        finally:
+            flush_events(args)
     return 0
 
 